@@ -63,7 +63,7 @@ __version__ = '2.2.4'
 
 # do not change this line manually
 # this is managed by proto/build-proto.sh and updated on every execution
-__proto_version__ = '0.0.86'
+__proto_version__ = '0.0.88'
 
 __uptime__ = _datetime.datetime.now().isoformat()
 
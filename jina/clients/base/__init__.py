@@ -6,7 +6,8 @@ import os
 from abc import ABC
 from typing import Callable, Union, Optional, Iterator, AsyncIterator
 
-from ..request import GeneratorSourceType
+from ..request import GeneratorSourceType, request_generator
+from ..request.asyncio import request_generator as async_request_generator
 from ...excepts import BadClientInput, ValidationError
 from ...helper import typename, ArgNamespace
 from ...logging.logger import JinaLogger
@@ -68,8 +69,6 @@ class BaseClient(ABC):
             )
 
         try:
-            from ..request import request_generator
-
             r = next(request_generator(**kwargs))
             if not isinstance(r, Request):
                 raise TypeError(f'{typename(r)} is not a valid Request')
@@ -86,23 +85,25 @@ class BaseClient(ABC):
         :param kwargs: Keyword arguments.
         :return: Iterator of request.
         """
-        _kwargs = vars(self.args)
+        # ``vars`` returns the namespace itself, copy it so that ``data`` and the
+        # caller-specific kwargs do not leak into ``self.args``
+        _kwargs = vars(self.args).copy()
         _kwargs['data'] = self.inputs
         # override by the caller-specific kwargs
         _kwargs.update(kwargs)
 
         if hasattr(self._inputs, '__len__'):
-            self._inputs_length = max(1, len(self._inputs) / _kwargs['request_size'])
+            # number of requests, i.e. ceil(len / request_size); <=0 means one request
+            request_size = _kwargs['request_size']
+            self._inputs_length = (
+                max(1, -(-len(self._inputs) // request_size)) if request_size > 0 else 1
+            )
         else:
             self._inputs_length = None
 
         if inspect.isasyncgen(self.inputs):
-            from ..request.asyncio import request_generator
-
-            return request_generator(**_kwargs)
+            return async_request_generator(**_kwargs)
         else:
-            from ..request import request_generator
-
             return request_generator(**_kwargs)
 
     @property
@@ -835,7 +835,7 @@ def get_full_version() -> Optional[Tuple[Dict, Dict]]:
             'libzmq': zmq.zmq_version(),
             'pyzmq': numpy.__version__,
             'protobuf': google.protobuf.__version__,
-            'proto-backend': api_implementation._default_implementation_type,
+            'proto-backend': api_implementation.Type(),
             'grpcio': getattr(grpc, '__version__', _grpcio_metadata.__version__),
             'pyyaml': yaml.__version__,
             'python': platform.python_version(),
@@ -1315,7 +1315,9 @@ def dunder_get(_dict: Any, key: str) -> Any:
 
     from google.protobuf.struct_pb2 import ListValue
     from google.protobuf.struct_pb2 import Struct
-    from google.protobuf.pyext._message import MessageMapContainer
+
+    # the map container class depends on the protobuf backend in use, take it from a live message
+    MessageMapContainer = type(Struct().fields)
 
     if isinstance(part1, int):
         result = _dict[part1]
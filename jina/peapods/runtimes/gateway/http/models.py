@@ -6,7 +6,7 @@ from typing import Callable, Dict, Any, Optional, List, Union, Tuple
 
 from google.protobuf.descriptor import Descriptor, FieldDescriptor
 from google.protobuf.json_format import MessageToDict
-from google.protobuf.pyext.cpp_message import GeneratedProtocolMessageType
+from google.protobuf.reflection import GeneratedProtocolMessageType
 from pydantic import Field, BaseModel, BaseConfig, create_model, root_validator
 
 from .....proto import jina_pb2
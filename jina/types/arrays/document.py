@@ -34,16 +34,9 @@ from ... import __windows__
 from ...helper import typename
 from ...proto import jina_pb2
 
-try:
-    # when protobuf using Cpp backend
-    from google.protobuf.pyext._message import (
-        RepeatedCompositeContainer as RepeatedContainer,
-    )
-except:
-    # when protobuf using Python backend
-    from google.protobuf.internal.containers import (
-        RepeatedCompositeFieldContainer as RepeatedContainer,
-    )
+# the repeated field container class depends on the protobuf backend in use (cpp or python),
+# which is not necessarily the one that can be imported, so take it from a message instance
+RepeatedContainer = type(jina_pb2.DocumentArrayProto().docs)
 
 __all__ = ['DocumentArray', 'DocumentArrayGetAttrMixin']
 
@@ -1,5 +1,6 @@
+import math
 import os
-from typing import Optional
+from typing import Optional, Tuple, Sequence
 
 import numpy as np
 
@@ -8,6 +9,171 @@ from ....proto import jina_pb2
 
 __all__ = ['BaseDenseNdArray']
 
+_Q_NONE, _Q_FP32, _Q_FP16, _Q_UINT8, _Q_INT8 = (
+    jina_pb2.DenseNdArrayProto.NONE,
+    jina_pb2.DenseNdArrayProto.FP32,
+    jina_pb2.DenseNdArrayProto.FP16,
+    jina_pb2.DenseNdArrayProto.UINT8,
+    jina_pb2.DenseNdArrayProto.INT8,
+)
+
+_FP16, _FP32, _FP64, _UINT8, _INT8 = (
+    np.dtype(np.float16),
+    np.dtype(np.float32),
+    np.dtype(np.float64),
+    np.dtype(np.uint8),
+    np.dtype(np.int8),
+)
+_FLOAT_DTYPES = (_FP32, _FP64, _FP16)
+_ZERO = np.float64(0)
+
+
+_QUANT_CHUNK_BYTES = 1 << 16
+_MINMAX_CHUNK_BYTES = 1 << 20
+
+
+def _minmax(x: 'np.ndarray') -> Tuple['np.number', 'np.number']:
+    """
+    Reduce the min and the max of ``x`` with a single pass over the memory.
+
+    Large arrays are reduced in chunks of ``_MINMAX_CHUNK_BYTES``, so that the max of each chunk
+    is taken while it is still in the CPU cache from taking its min. Small or non-contiguous
+    arrays just use ``x.min()`` and ``x.max()``.
+
+    :param x: the ndarray to reduce, must not be empty
+    :return: a tuple of the min value and the max value
+    """
+    if x.nbytes <= _MINMAX_CHUNK_BYTES or not x.flags.c_contiguous:
+        return x.min(), x.max()
+
+    x = x.reshape(-1)
+    chunk = _MINMAX_CHUNK_BYTES // x.itemsize
+    min_val, max_val = x[:chunk].min(), x[:chunk].max()
+    for start in range(chunk, x.size, chunk):
+        block = x[start : start + chunk]
+        # ``np.minimum`` and ``np.maximum`` propagate NaN as ``x.min()`` does
+        min_val = np.minimum(min_val, block.min())
+        max_val = np.maximum(max_val, block.max())
+    return min_val, max_val
+
+
+def _flat(x: 'np.ndarray'):
+    """
+    Get a 1-d view of ``x`` in C order that can be sliced chunk by chunk.
+
+    :param x: the ndarray to flatten
+    :return: a flat view when ``x`` is C-contiguous, otherwise an iterator that copies only
+        the slices taken from it
+    """
+    return x.reshape(-1) if x.flags.c_contiguous else x.flat
+
+
+def _quantize_uint8(
+    x: 'np.ndarray',
+    out: 'np.ndarray',
+    min_val: Optional[float] = None,
+    max_val: Optional[float] = None,
+    quant_power: float = 1.0,
+) -> Tuple[float, float, float]:
+    """
+    Quantize ``x`` into the preallocated ``uint8`` buffer ``out`` using min/max scaling.
+
+    The values are companded, shifted and scaled in chunks of ``_QUANT_CHUNK_BYTES``, which
+    stay in the CPU cache and are divided straight into ``out``. The only float temporary is
+    one chunk, instead of an array as large as ``x``. A non-contiguous ``x`` is gathered one
+    chunk at a time as well, rather than copied as a whole.
+
+    :param x: the float ndarray to quantize
+    :param out: the C-contiguous ``uint8`` ndarray with the same shape as ``x`` to write into
+    :param min_val: the min value of ``x`` to scale from, computed from ``x`` when not given
+    :param max_val: the max value of ``x`` to scale to, computed from ``x`` when not given
+    :param quant_power: the values are companded by ``sign(x) * |x| ** (1 / quant_power)``
+        before scaling, ``1.0`` means none
+    :return: a tuple of the (companded) min value, the (companded) max value and the scale
+    """
+    if min_val is None or max_val is None:
+        min_val, max_val = _minmax(x) if x.size else (0, 0)
+    if quant_power != 1:
+        # companding is monotonic, the companded range is the one of the companded min/max
+        inv_power = 1 / quant_power
+        min_val = math.copysign(abs(min_val) ** inv_power, min_val)
+        max_val = math.copysign(abs(max_val) ** inv_power, max_val)
+    # round to float32 first, so that the values match the ones stored in the protobuf
+    min_val, max_val = float(np.float32(min_val)), float(np.float32(max_val))
+    scale = float(np.float32((max_val - min_val) / 255))
+    if not scale:
+        # constant values, all of them are stored as ``min_val``
+        out[...] = 0
+        return min_val, max_val, scale
+
+    flat, out = _flat(x), out.reshape(-1)
+    chunk = max(1, _QUANT_CHUNK_BYTES // x.itemsize)
+    buf = np.empty(min(chunk, x.size), dtype=x.dtype)
+    for start in range(0, x.size, chunk):
+        block = flat[start : start + chunk]
+        tmp = buf[: block.size]
+        if quant_power != 1:
+            np.abs(block, out=tmp)
+            np.power(tmp, inv_power, out=tmp)
+            np.copysign(tmp, block, out=tmp)
+            block = tmp
+        np.subtract(block, min_val, out=tmp)
+        np.divide(tmp, scale, out=out[start : start + chunk], casting='unsafe')
+    return min_val, max_val, scale
+
+
+def _quantize_int8(x: 'np.ndarray', out: 'np.ndarray') -> float:
+    """
+    Quantize ``x`` into the preallocated ``int8`` buffer ``out`` using symmetric scaling.
+
+    The zero point is fixed at 0, so ``x`` is mapped onto ``[-127, 127]`` by its max absolute
+    value and only the scale is needed to recover it. Chunked the same way as :func:`_quantize_uint8`.
+
+    :param x: the float ndarray to quantize
+    :param out: the C-contiguous ``int8`` ndarray with the same shape as ``x`` to write into
+    :return: the scale
+    """
+    min_val, max_val = _minmax(x) if x.size else (0, 0)
+    # round to float32 first, so that the value matches the one stored in the protobuf
+    scale = float(np.float32(max(-min_val, max_val) / 127))
+    if not scale:
+        # all zeros, nothing to scale
+        out[...] = 0
+        return scale
+
+    flat, out = _flat(x), out.reshape(-1)
+    chunk = max(1, _QUANT_CHUNK_BYTES // x.itemsize)
+    buf = np.empty(min(chunk, x.size), dtype=x.dtype)
+    for start in range(0, x.size, chunk):
+        block = flat[start : start + chunk]
+        tmp = buf[: block.size]
+        np.divide(block, scale, out=tmp)
+        np.rint(tmp, out=tmp)
+        np.clip(tmp, -127, 127, out=tmp)
+        np.copyto(out[start : start + chunk], tmp, casting='unsafe')
+    return scale
+
+
+# ``dtype.str`` builds a new string on every access, cache it per dtype
+_DTYPE_STR = {}
+
+
+def _write_blob(blob: 'jina_pb2.DenseNdArrayProto', x: 'np.ndarray') -> None:
+    """
+    Write the buffer, the shape and the dtype of ``x`` into ``blob``.
+
+    :param blob: the protobuf message to write into
+    :param x: the (quantized) ndarray to store
+    """
+    # protobuf 3.x rejects a memoryview for a ``bytes`` field, and going through
+    # ``bytes(memoryview(x))`` copies just as much as ``tobytes()``
+    blob.buffer = x.tobytes()
+    blob.shape[:] = x.shape
+    dtype_str = _DTYPE_STR.get(x.dtype)
+    if dtype_str is None:
+        dtype_str = _DTYPE_STR[x.dtype] = x.dtype.str
+    blob.dtype = dtype_str
+
 
 class DenseNdArray(BaseDenseNdArray):
     """
@@ -17,51 +183,97 @@ class DenseNdArray(BaseDenseNdArray):
 
     :param proto: the protobuf message, when not given then create a new one
     :param dtype: the dtype used when stored as protobuf message.
+    :param quant_power: the power used to compand the values before ``uint8`` quantization,
+        ``1.0`` means plain min/max scaling, must be positive.
     :param args: Additional positional arguments which are just used for the parent initialization
     :param kwargs: Additional keyword arguments which are just used for the parent initialization
-        Availables are ``fp16``, ``uint8``, default is None.
+        Availables are ``fp32``, ``fp16``, ``uint8``, ``int8``, default is None.
 
     .. note::
         Remarks on quantization:
         The quantization only works when ``x`` is in ``float32`` or ``float64``. The motivation is to
         save the network bandwidth by using less bits to store the numpy array in the protobuf.
 
+            - ``fp32`` quantization stores ``float64`` in 32 bits, lossy.
             - ``fp16`` quantization is lossless, can be used widely. Each float is represented by 16 bits.
+            - An input already in the target dtype of ``fp32`` or ``fp16`` is stored as is, without an
+            extra copy.
             - ``uint8`` quantization is lossy. Each float is represented by 8 bits.
-            The algorithm behind is standard scaling.
+            The algorithm behind is standard scaling. With ``quant_power > 1`` the values are first
+            companded by ``sign(x) * |x| ** (1 / quant_power)``, so that more of the 256 levels are
+            spent on the low magnitudes instead of on the outliers.
+            - ``int8`` quantization is lossy. Each float is represented by 8 bits, using symmetric
+            scaling by the max absolute value. Only ``scale`` is stored, the zero point is always 0,
+            so the raw buffer can be fed to int8 dot-product kernels as is.
 
-        the quantize type is stored and the blob is self-contained to recover the original numpy array
+        the quantize type and the ``original_dtype`` of the input are stored, the blob is self-contained
+        to recover the original numpy array in its original dtype
     """
 
+    # the setter specialized for each ``dtype``, any other ``dtype`` stores without quantization
+    _SETTERS = {
+        'fp32': '_set_fp32',
+        'fp16': '_set_fp16',
+        'uint8': '_set_uint8',
+        'int8': '_set_int8',
+    }
+
     def __init__(
         self,
         proto: Optional['jina_pb2.NdArrayProto'] = None,
         dtype: Optional[str] = None,
+        quant_power: float = 1.0,
         *args,
-        **kwargs
+        **kwargs,
     ):
+        if quant_power <= 0:
+            raise ValueError(f'quant_power must be positive, got {quant_power}')
         super().__init__(proto, *args, **kwargs)
         self._dtype = dtype or os.environ.get('JINA_ARRAY_QUANT')
+        # round to float32 first, so that it matches the power stored in the protobuf
+        self._quant_power = float(np.float32(quant_power))
+        # ``dtype`` is fixed from here on, resolve the branch of the setter once. Keep the
+        # plain function rather than a bound method, which would tie ``self`` in a ref cycle
+        self._set_value = getattr(
+            type(self), self._SETTERS.get(self._dtype, '_set_none')
+        )
 
     @property
     def value(self) -> 'np.ndarray':
         """
         Get the value of protobuf and return in :class:`np.ndarray`.
 
+        When the protobuf only has a shape but no buffer, a read-only array of zeros is returned,
+        use ``.copy()`` on it if you need to write into it.
+
         :return: ndarray value
         """
         blob = self._pb_body
         if blob.buffer:
-            x = np.frombuffer(blob.buffer, dtype=blob.dtype)
+            # reshaping the zero-copy view is free, the dequantization below then
+            # writes straight into an array of the final shape
+            x = np.frombuffer(blob.buffer, dtype=blob.dtype).reshape(blob.shape)
 
-            if blob.quantization == jina_pb2.DenseNdArrayProto.FP16:
+            if blob.quantization == _Q_FP16 or blob.quantization == _Q_FP32:
+                x = x.astype(blob.original_dtype, copy=False)
+            elif blob.quantization == _Q_UINT8:
+                # scale and shift in-place on the single casted copy, no temporaries
                 x = x.astype(blob.original_dtype)
-            elif blob.quantization == jina_pb2.DenseNdArrayProto.UINT8:
-                x = x.astype(blob.original_dtype) * blob.scale + blob.min_val
+                x *= blob.scale
+                x += blob.min_val
+                if blob.quant_power and blob.quant_power != 1:
+                    # expand the companded values back, sign(x) * |x| ** quant_power
+                    mag = np.abs(x)
+                    mag **= blob.quant_power
+                    np.copysign(mag, x, out=x)
+            elif blob.quantization == _Q_INT8:
+                x = x.astype(blob.original_dtype)
+                x *= blob.scale
 
-            return x.reshape(blob.shape)
+            return x
         elif len(blob.shape) > 0:
-            return np.zeros(blob.shape)
+            # a read-only zero-strided view, no allocation regardless of the shape
+            return np.broadcast_to(_ZERO, tuple(blob.shape))
 
     @value.setter
     def value(self, value: 'np.ndarray'):
@@ -70,29 +282,91 @@ class DenseNdArray(BaseDenseNdArray):
 
         :param value: set the ndarray
         """
-        blob = self._pb_body
-        x = value
+        self._set_value(self, self._pb_body, value)
 
-        if self._dtype == 'fp32' and x.dtype == np.float64:
-            blob.quantization = jina_pb2.DenseNdArrayProto.FP32
-            blob.original_dtype = x.dtype.name
-            x = x.astype(np.float32)
-        elif self._dtype == 'fp16' and (x.dtype == np.float32 or x.dtype == np.float64):
-            blob.quantization = jina_pb2.DenseNdArrayProto.FP16
-            blob.original_dtype = x.dtype.name
-            x = x.astype(np.float16)
-        elif self._dtype == 'uint8' and (
-            x.dtype == np.float32 or x.dtype == np.float64 or x.dtype == np.float16
-        ):
-            blob.quantization = jina_pb2.DenseNdArrayProto.UINT8
-            blob.max_val, blob.min_val = x.max(), x.min()
-            blob.original_dtype = x.dtype.name
-            blob.scale = (blob.max_val - blob.min_val) / 256
-            x = ((x - blob.min_val) / blob.scale).astype(np.uint8)
+    def _set_none(self, blob: 'jina_pb2.DenseNdArrayProto', x: 'np.ndarray') -> None:
+        blob.quantization = _Q_NONE
+        _write_blob(blob, x)
+
+    def _set_fp32(self, blob: 'jina_pb2.DenseNdArrayProto', x: 'np.ndarray') -> None:
+        if x.dtype != _FP64 and x.dtype != _FP32:
+            return self._set_none(blob, x)
+        blob.quantization = _Q_FP32
+        blob.original_dtype = x.dtype.name
+        # no copy when ``x`` is already in float32
+        _write_blob(blob, x.astype(_FP32, copy=False))
+
+    def _set_fp16(self, blob: 'jina_pb2.DenseNdArrayProto', x: 'np.ndarray') -> None:
+        if x.dtype not in _FLOAT_DTYPES:
+            return self._set_none(blob, x)
+        blob.quantization = _Q_FP16
+        blob.original_dtype = x.dtype.name
+        # no copy when ``x`` is already in float16
+        _write_blob(blob, x.astype(_FP16, copy=False))
+
+    def _set_uint8(self, blob: 'jina_pb2.DenseNdArrayProto', x: 'np.ndarray') -> None:
+        if x.dtype not in _FLOAT_DTYPES:
+            return self._set_none(blob, x)
+        blob.quantization = _Q_UINT8
+        blob.original_dtype = x.dtype.name
+        if self._quant_power != 1:
+            blob.quant_power = self._quant_power
         else:
-            blob.quantization = jina_pb2.DenseNdArrayProto.NONE
+            blob.ClearField('quant_power')
+        out = np.empty(x.shape, dtype=_UINT8)
+        blob.min_val, blob.max_val, blob.scale = _quantize_uint8(
+            x, out, quant_power=self._quant_power
+        )
+        _write_blob(blob, out)
+
+    def _set_int8(self, blob: 'jina_pb2.DenseNdArrayProto', x: 'np.ndarray') -> None:
+        if x.dtype not in _FLOAT_DTYPES:
+            return self._set_none(blob, x)
+        blob.quantization = _Q_INT8
+        blob.original_dtype = x.dtype.name
+        blob.ClearField('min_val')
+        blob.ClearField('max_val')
+        blob.ClearField('quant_power')
+        out = np.empty(x.shape, dtype=_INT8)
+        blob.scale = _quantize_int8(x, out)
+        _write_blob(blob, out)
 
-        blob.buffer = x.tobytes()
-        blob.ClearField('shape')
-        blob.shape.extend(list(x.shape))
-        blob.dtype = x.dtype.str
+    @classmethod
+    def batch_quantize_uint8(
+        cls,
+        arrays: Sequence['np.ndarray'],
+        protos: Sequence['jina_pb2.DenseNdArrayProto'],
+    ) -> None:
+        """
+        Quantize a batch of float ndarrays into ``uint8`` with one min/max scaling shared by all.
+
+        The min and max are reduced once over the whole batch, then each ndarray is quantized
+        straight into its own protobuf message. Every message stores the shared ``scale`` and
+        ``min_val``, hence is still self-contained and can be read by :attr:`value`.
+
+        :param arrays: the ``float16``, ``float32`` or ``float64`` ndarrays to quantize
+        :param protos: the protobuf messages to write into, one for each ndarray
+        """
+        if len(arrays) != len(protos):
+            raise ValueError(
+                f'got {len(arrays)} ndarrays but {len(protos)} protobuf messages'
+            )
+        for x in arrays:
+            if x.dtype not in _FLOAT_DTYPES:
+                raise TypeError(f'uint8 quantization does not support {x.dtype}')
+
+        min_val = max_val = 0
+        non_empty = [x for x in arrays if x.size]
+        if non_empty:
+            min_vals, max_vals = zip(*(_minmax(x) for x in non_empty))
+            min_val, max_val = np.min(min_vals), np.max(max_vals)
+
+        for x, blob in zip(arrays, protos):
+            blob.quantization = _Q_UINT8
+            blob.original_dtype = x.dtype.name
+            blob.ClearField('quant_power')
+            out = np.empty(x.shape, dtype=_UINT8)
+            blob.min_val, blob.max_val, blob.scale = _quantize_uint8(
+                x, out, min_val, max_val
+            )
+            _write_blob(blob, out)
@@ -85,5 +85,4 @@ class BaseSparseNdArray(BaseNdArray):
         r = self.sparse_parser(value)
         DenseNdArray(self._pb_body.indices).value = r['indices']
         DenseNdArray(self._pb_body.values).value = r['values']
-        self._pb_body.ClearField('shape')
-        self._pb_body.shape.extend(r['shape'])
+        self._pb_body.shape[:] = r['shape']
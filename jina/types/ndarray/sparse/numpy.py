@@ -41,4 +41,4 @@ class SparseNdArray(BaseSparseNdArray):
         nv = np.nonzero(value)
         val = value[nv]
         indices = np.transpose(nv)
-        return {'indices': indices, 'values': val, 'shape': list(value.shape)}
+        return {'indices': indices, 'values': val, 'shape': value.shape}
@@ -4,7 +4,7 @@ import time
 import pytest
 import requests
 
-from jina import Executor, DocumentArray, requests as req
+from jina import Executor, Document, DocumentArray, requests as req
 from jina import Flow, __windows__
 from jina import helper
 from jina.clients import Client
@@ -65,6 +65,26 @@ def test_check_input_fail(inputs):
         client.check_input(inputs)
 
 
+def test_get_requests_keeps_args_untouched():
+    client = Client(host='localhost', port_jinad=12345)
+    client.inputs = [Document(), Document()]
+    reqs = list(client._get_requests(exec_endpoint='/foo', request_size=1))
+    assert len(reqs) == 2
+    assert not hasattr(client.args, 'data')
+    assert not hasattr(client.args, 'exec_endpoint')
+
+
+@pytest.mark.parametrize(
+    'num_docs, request_size, inputs_length',
+    [(10, 3, 4), (9, 3, 3), (0, 3, 1), (5, 0, 1)],
+)
+def test_get_requests_inputs_length(num_docs, request_size, inputs_length):
+    client = Client(host='localhost', port_jinad=12345)
+    client.inputs = [Document() for _ in range(num_docs)]
+    client._get_requests(exec_endpoint='/foo', request_size=request_size)
+    assert client._inputs_length == inputs_length
+
+
 @pytest.mark.parametrize(
     'port_expose, route, status_code',
     [(helper.random_port(), '/status', 200), (helper.random_port(), '/api/ass', 404)],
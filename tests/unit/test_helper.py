@@ -81,6 +81,10 @@ def test_dunder_get():
     assert dunder_get(a, 'b__d__g__0') == 0
     assert dunder_get(a, 'b__d__g__2__h') == 'i'
 
+    d = jina_pb2.DocumentProto()
+    d.scores['cosine'].value = 0.5
+    assert dunder_get(d, 'scores__cosine__value') == 0.5
+
 
 def test_check_update():
     assert _is_latest_version()
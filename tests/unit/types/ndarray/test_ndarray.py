@@ -1,6 +1,12 @@
+import gc
+import warnings
+import weakref
+
 import numpy as np
 import pytest
 
+from jina.proto import jina_pb2
+
 
 def test_empty_ndarray():
     from jina.types.ndarray.dense.numpy import DenseNdArray
@@ -68,6 +74,214 @@ def test_numpy_dense(dtype):
     np.testing.assert_equal(b.value, a)
 
 
+def test_numpy_dense_shape_only():
+    from jina.types.ndarray.dense.numpy import DenseNdArray
+
+    b = DenseNdArray()
+    b.proto.shape.extend([10, 6])
+    np.testing.assert_equal(b.value, np.zeros([10, 6]))
+    assert not b.value.flags.writeable
+
+
+@pytest.mark.parametrize('dtype', [None, 'fp32', 'fp16', 'uint8', 'int8'])
+def test_numpy_dense_freed_without_gc(dtype):
+    from jina.types.ndarray.dense.numpy import DenseNdArray
+
+    gc.disable()
+    try:
+        b = DenseNdArray(dtype=dtype)
+        b.value = np.random.random([10, 6])
+        ref = weakref.ref(b)
+        del b
+        assert ref() is None
+    finally:
+        gc.enable()
+
+
+@pytest.mark.parametrize('dtype', ['float64', 'float32', 'float16'])
+def test_numpy_dense_uint8_quant(dtype):
+    from jina.types.ndarray.dense.numpy import DenseNdArray
+
+    a = (100 * np.random.random([10, 6, 8, 2])).astype(dtype)
+    b = DenseNdArray(dtype='uint8')
+    b.value = a
+    assert b.proto.quantization == jina_pb2.DenseNdArrayProto.UINT8
+    assert len(b.proto.buffer) == a.size
+    np.testing.assert_equal(b.value.shape, a.shape)
+    assert b.value.dtype == a.dtype
+    np.testing.assert_allclose(b.value, a, atol=b.proto.scale + 1e-2)
+
+
+@pytest.mark.parametrize('shape', [[1000], [1000, 1000], [1000, 1000, 2]])
+def test_numpy_dense_uint8_quant_min_max(shape):
+    from jina.types.ndarray.dense.numpy import DenseNdArray
+
+    a = np.random.random(shape).astype(np.float32)
+    a.flat[np.random.randint(a.size)] = -1
+    a.flat[np.random.randint(a.size)] = 2
+    b = DenseNdArray(dtype='uint8')
+    b.value = a
+    assert b.proto.min_val == -1
+    assert b.proto.max_val == 2
+
+
+@pytest.mark.parametrize('dtype', ['uint8', 'int8'])
+@pytest.mark.parametrize('shape', [[4], [0], [0, 3]])
+def test_numpy_dense_quant_constant(dtype, shape):
+    from jina.types.ndarray.dense.numpy import DenseNdArray
+
+    a = np.full(shape, 3.0)
+    b = DenseNdArray(dtype=dtype)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        b.value = a
+    np.testing.assert_equal(b.value.shape, a.shape)
+    np.testing.assert_allclose(b.value, a, atol=0.05)
+
+
+def test_numpy_dense_uint8_quant_power():
+    from jina.types.ndarray.dense.numpy import DenseNdArray
+
+    # heavy-tailed values, most of them are close to zero
+    a = np.random.standard_cauchy([1000]).clip(-100, 100)
+    err = {}
+    for quant_power in (1.0, 2.0):
+        b = DenseNdArray(dtype='uint8', quant_power=quant_power)
+        b.value = a
+        assert len(b.proto.buffer) == a.size
+        np.testing.assert_equal(b.value.shape, a.shape)
+        err[quant_power] = np.abs(b.value - a)[np.abs(a) < 1].mean()
+    assert err[2.0] < err[1.0]
+
+
+def test_numpy_dense_uint8_quant_power_float32():
+    from jina.types.ndarray.dense.numpy import DenseNdArray
+
+    b = DenseNdArray(dtype='uint8', quant_power=2.2)
+    b.value = np.random.random([10])
+    # encoded and decoded with the same exponent
+    assert b._quant_power == b.proto.quant_power
+
+
+@pytest.mark.parametrize('quant_power', [0, -1.0])
+def test_numpy_dense_uint8_quant_power_invalid(quant_power):
+    from jina.types.ndarray.dense.numpy import DenseNdArray
+
+    with pytest.raises(ValueError):
+        DenseNdArray(dtype='uint8', quant_power=quant_power)
+
+
+@pytest.mark.parametrize('quant_power', [1.0, 2.0])
+def test_numpy_dense_uint8_quant_chunked(quant_power):
+    import tracemalloc
+    from jina.types.ndarray.dense.numpy import DenseNdArray
+
+    a = np.random.standard_cauchy([1000, 1000])
+    expected = DenseNdArray(dtype='uint8', quant_power=quant_power)
+    expected.value = np.ascontiguousarray(a.T)
+
+    b = DenseNdArray(dtype='uint8', quant_power=quant_power)
+    tracemalloc.start()
+    try:
+        # non-contiguous input, companded and gathered one chunk at a time
+        b.value = a.T
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # the ``uint8`` output and its serialized copy, no float array as large as ``a``
+    assert peak < a.nbytes / 2
+    assert b.proto.buffer == expected.proto.buffer
+    np.testing.assert_equal(b.value, expected.value)
+
+
+def test_numpy_dense_batch_quantize_uint8():
+    from jina.types.ndarray.dense.numpy import DenseNdArray
+
+    arrays = [
+        np.random.random([10, 6]),
+        10 * np.random.random([3]).astype(np.float32),
+        np.zeros([0, 4]),
+    ]
+    protos = [jina_pb2.DenseNdArrayProto() for _ in arrays]
+    DenseNdArray.batch_quantize_uint8(arrays, protos)
+
+    scale = protos[0].scale
+    for a, p in zip(arrays, protos):
+        assert p.quantization == jina_pb2.DenseNdArrayProto.UINT8
+        assert p.scale == scale
+        b = DenseNdArray(p).value
+        assert b.dtype == a.dtype
+        np.testing.assert_equal(b.shape, a.shape)
+        np.testing.assert_allclose(b, a, atol=scale + 1e-2)
+
+    protos = [jina_pb2.DenseNdArrayProto()]
+    DenseNdArray.batch_quantize_uint8([np.zeros([0])], protos)
+    assert DenseNdArray(protos[0]).value.shape == (0,)
+
+    # a batch of constant embeddings has scale 0
+    arrays = [np.zeros([10, 6], np.float32), np.zeros([3], np.float32)]
+    protos = [jina_pb2.DenseNdArrayProto() for _ in arrays]
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        DenseNdArray.batch_quantize_uint8(arrays, protos)
+    for a, p in zip(arrays, protos):
+        assert p.scale == 0
+        np.testing.assert_equal(DenseNdArray(p).value, a)
+
+    with pytest.raises(ValueError):
+        DenseNdArray.batch_quantize_uint8(arrays, protos[:1])
+    with pytest.raises(TypeError):
+        DenseNdArray.batch_quantize_uint8(
+            [np.ones(3, dtype=np.int32)], [jina_pb2.DenseNdArrayProto()]
+        )
+
+
+@pytest.mark.parametrize('dtype', ['float64', 'float32', 'float16'])
+def test_numpy_dense_int8_quant(dtype):
+    from jina.types.ndarray.dense.numpy import DenseNdArray
+
+    a = (100 * np.random.random([10, 6, 8, 2]) - 50).astype(dtype)
+    b = DenseNdArray(dtype='int8')
+    b.value = a
+    assert b.proto.quantization == jina_pb2.DenseNdArrayProto.INT8
+    assert b.proto.min_val == b.proto.max_val == 0
+    assert len(b.proto.buffer) == a.size
+    np.testing.assert_equal(b.value.shape, a.shape)
+    assert b.value.dtype == a.dtype
+    np.testing.assert_allclose(b.value, a, rtol=1e-3, atol=b.proto.scale / 2 + 1e-2)
+
+    b.value = np.zeros([3, 4], dtype=dtype)
+    np.testing.assert_equal(b.value, np.zeros([3, 4]))
+
+
+@pytest.mark.parametrize('dtype', ['float64', 'float32', 'float16'])
+def test_numpy_dense_fp16_quant(dtype):
+    from jina.types.ndarray.dense.numpy import DenseNdArray
+
+    a = np.random.random([10, 6, 8, 2]).astype(dtype)
+    b = DenseNdArray(dtype='fp16')
+    b.value = a
+    assert b.proto.quantization == jina_pb2.DenseNdArrayProto.FP16
+    assert b.proto.original_dtype == dtype
+    assert len(b.proto.buffer) == a.size * 2
+    assert b.value.dtype == a.dtype
+    np.testing.assert_allclose(b.value, a, rtol=1e-3, atol=1e-4)
+
+
+@pytest.mark.parametrize('dtype', ['float64', 'float32'])
+def test_numpy_dense_fp32_quant(dtype):
+    from jina.types.ndarray.dense.numpy import DenseNdArray
+
+    a = np.random.random([10, 6, 8, 2]).astype(dtype)
+    b = DenseNdArray(dtype='fp32')
+    b.value = a
+    assert b.proto.quantization == jina_pb2.DenseNdArrayProto.FP32
+    assert b.proto.original_dtype == dtype
+    assert len(b.proto.buffer) == a.size * 4
+    assert b.value.dtype == a.dtype
+    np.testing.assert_allclose(b.value, a, rtol=1e-6)
+
+
 @pytest.mark.parametrize(
     'idx_shape',
     [